@@ -8,5 +8,6 @@ setup(
     install_requires=[
         # from requirements.txt
         'requests'],
-    extra_requires={'dev': dev},
+    extras_require={'dev': dev, 'async': ['aiohttp'],
+                    'orjson': ['orjson'], 'brotli': ['brotli']},
 )
\ No newline at end of file
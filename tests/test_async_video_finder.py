@@ -0,0 +1,118 @@
+import asyncio
+from urllib.parse import parse_qs
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+from video_finder.async_video_finder import AsyncYoutubeAPI  # noqa: E402
+from video_finder.async_video_finder import AsyncYoutubeFinder  # noqa: E402
+from video_finder.video_finder import Order, EventType  # noqa: E402
+from video_finder.video_finder import VideoDuration  # noqa: E402
+
+_DEVELOPER_KEY = "fake-dev-key"
+
+
+def _mock_request(monkeypatch, api, calls):
+    async def mock_request(method="search", params=dict()):
+        calls.append((method, params))
+        ids = params['id'].split(',')
+        return {'items': [{'kind': "youtube#video", 'id': i} for i in ids]}
+
+    monkeypatch.setattr(api, "_request", mock_request)
+
+
+class TestAsyncYoutubeAPI:
+
+    def test_videos_all(self, monkeypatch):
+        api = AsyncYoutubeAPI(_DEVELOPER_KEY)
+        calls = []
+        _mock_request(monkeypatch, api, calls)
+        video_ids = tuple(f"id{i}" for i in range(120))
+        items = asyncio.run(api.videos_all(video_ids))
+        assert [item['id'] for item in items] == list(video_ids)
+        assert [method for method, _ in calls] == ["videos"] * 3
+        assert all(params['maxResults'] == 50 for _, params in calls)
+
+    def test_channels_all(self, monkeypatch):
+        api = AsyncYoutubeAPI(_DEVELOPER_KEY)
+        calls = []
+        _mock_request(monkeypatch, api, calls)
+        items = asyncio.run(api.channels_all(("a", "b")))
+        assert [item['id'] for item in items] == ["a", "b"]
+        assert len(calls) == 1
+
+    def test_videos_all_empty(self, monkeypatch):
+        api = AsyncYoutubeAPI(_DEVELOPER_KEY)
+        calls = []
+        _mock_request(monkeypatch, api, calls)
+        assert asyncio.run(api.videos_all(())) == []
+        assert calls == []
+
+    def test_sync_with(self):
+        api = AsyncYoutubeAPI(_DEVELOPER_KEY)
+        with pytest.raises(TypeError, match="async with"):
+            with api:
+                pass
+
+    def test_search_query_string(self):
+        queries = []
+
+        async def handler(request):
+            queries.append(request.query_string)
+            return web.json_response({'items': []})
+
+        async def search():
+            app = web.Application()
+            app.router.add_get("/search", handler)
+            async with TestServer(app) as server:
+                async with AsyncYoutubeAPI(_DEVELOPER_KEY) as api:
+                    api._endpoints['search'] = str(server.make_url("/search"))
+                    await api.search(order=Order.RATING,
+                                     event_type=EventType.LIVE,
+                                     duration=VideoDuration.SHORT)
+
+        asyncio.run(search())
+        # enum values, not their names
+        query = parse_qs(queries[0])
+        assert query['order'] == ["rating"]
+        assert query['eventType'] == ["live"]
+        assert query['videoDuration'] == ["short"]
+        assert query['type'] == ["video"]
+
+
+class TestAsyncYoutubeFinder:
+
+    def test_sync_with(self):
+        finder = AsyncYoutubeFinder(_DEVELOPER_KEY)
+        with pytest.raises(TypeError, match="async with"):
+            with finder:
+                pass
+
+    def test_get_channel(self, monkeypatch):
+        finder = AsyncYoutubeFinder(_DEVELOPER_KEY)
+        _mock_request(monkeypatch, finder._api, [])
+        channel = asyncio.run(finder.get_channel("UC4ixAu7SMqHz6n-rtjsgAtA"))
+        assert channel.channel_id == "UC4ixAu7SMqHz6n-rtjsgAtA"
+
+    def test_search_videos_max_results(self, monkeypatch):
+        finder = AsyncYoutubeFinder(_DEVELOPER_KEY)
+        calls = []
+
+        async def mock_request(method="search", params=dict()):
+            calls.append(params)
+            return {'items': [{'kind': "youtube#searchResult",
+                               'id': {'videoId': "id"}}],
+                    'nextPageToken': "next"}
+
+        monkeypatch.setattr(finder._api, "_request", mock_request)
+        assert asyncio.run(finder.search_videos(max_results=0)) == []
+        assert calls == []
+        # positional params like the sync finder
+        videos = asyncio.run(finder.search_videos(
+                False, "UC4ixAu7SMqHz6n-rtjsgAtA", max_results=2
+        ))
+        assert len(videos) == 2
+        assert len(calls) == 2
+        assert calls[0]['channelId'] == "UC4ixAu7SMqHz6n-rtjsgAtA"
@@ -1,10 +1,19 @@
 import os
+import json
 import logging
+import time
+import threading
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 from datetime import datetime
-import requests
+import pytest
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from video_finder import video_finder
 from video_finder.video_finder import YoutubeAPI, YoutubeFinder
-from video_finder.video_finder import Order
+from video_finder.video_finder import YoutubeAPIException, RequestCache
+from video_finder.video_finder import YoutubeVideo, YoutubeChannel
+from video_finder.video_finder import Order, ResultType
 from video_finder.video_finder import VideoDuration
 from video_finder.video_finder import VideoEmbeddable, EventType
 from video_finder.video_finder import VideoDefinition, VideoCaption
@@ -36,16 +45,21 @@ search_query = {
 }
 
 
-class MockResponse:
+def _load_response(name):
+    path = os.path.join(os.path.dirname(__file__), f"{name}.json")
+    with open(path) as f:
+        return json.load(f)
+
 
-    @staticmethod
-    def json():
-        return {"mock_key": "mock_response"}
+class MockResponse:
 
+    content = b'{"mock_key": "mock_response", "etag": "mock-etag"}'
+    status_code = 200
+    ok = True
     url = "https://fake/url/for/test/"
 
 
-def _test_params(monkeypatch, expected_params, expected_endpoint):
+def _test_params(monkeypatch, api, expected_params, expected_endpoint):
     def mock_get(*args, **kwargs):
         endpoint = args[0]
         params = kwargs['params']
@@ -53,8 +67,60 @@ def _test_params(monkeypatch, expected_params, expected_endpoint):
         assert params == expected_params
         return MockResponse()
 
-    # apply the monkeypatch for requests.get to mock_get
-    monkeypatch.setattr(requests, "get", mock_get)
+    # apply the monkeypatch for the api session get to mock_get
+    monkeypatch.setattr(api._session, "get", mock_get)
+
+
+class MockFixtureResponse(MockResponse):
+    def __init__(self, response):
+        self.content = json.dumps(response).encode("utf-8")
+
+
+class MockForbidden(MockResponse):
+    content = b'{"error": {"code": 403, "message": "quotaExceeded"}}'
+    text = content.decode("utf-8")
+    status_code = 403
+    ok = False
+
+
+class MockNotModified(MockResponse):
+    content = b''
+    status_code = 304
+
+
+def _count_requests(monkeypatch, api):
+    calls = []
+
+    def mock_get(*args, **kwargs):
+        calls.append(kwargs['params'])
+        if (kwargs.get('headers') or {}).get('If-None-Match') == "mock-etag":
+            return MockNotModified()
+        return MockResponse()
+
+    monkeypatch.setattr(api._session, "get", mock_get)
+    return calls
+
+
+def _channels_requests(monkeypatch, api):
+    calls = []
+
+    def mock_get(*args, **kwargs):
+        calls.append(kwargs['params'])
+        return MockFixtureResponse(_load_response("channels"))
+
+    monkeypatch.setattr(api._session, "get", mock_get)
+    return calls
+
+
+def _mock_ids_request(monkeypatch, api, method):
+    calls = []
+
+    def mock_request(ids, part="", fields=""):
+        calls.append(ids)
+        return {'items': [{'id': i} for i in ids]}
+
+    monkeypatch.setattr(api, method, mock_request)
+    return calls
 
 
 class TestYoutubeAPI:
@@ -66,35 +132,126 @@ class TestYoutubeAPI:
         search_query = "py test"
         expected_params = {
                 'part': 'snippet',
-                'maxResults': '50',
+                'maxResults': 50,
                 'q': search_query,
                 'order': 'date',
                 'type': 'video',
                 'key': YOUTUBE_API_KEY}
         expected_endpoint = f"{YoutubeAPI.BASE_URL}search"
-        _test_params(monkeypatch, expected_params, expected_endpoint)
+        _test_params(monkeypatch, self.api, expected_params, expected_endpoint)
         self.api.search(search_query=search_query)
 
+    def test_search_video_params(self, monkeypatch):
+        params = search_query['all_video_params']
+        published_before = params['published_before'].astimezone()
+        expected_params = {
+                'part': 'snippet',
+                'maxResults': 50,
+                'q': "Yoga",
+                'channelId': "UCV73LMcuZQfH5If9JBFb43Q",
+                'order': 'rating',
+                'type': 'video',
+                'publishedBefore': published_before.isoformat(),
+                'relevanceLanguage': "de",
+                'eventType': 'completed',
+                'videoDuration': 'any',
+                'videoCaption': 'any',
+                'videoEmbeddable': 'true',
+                'videoDefinition': 'any',
+                'relatedToVideoId': "KkXrClafQYo",
+                'key': YOUTUBE_API_KEY}
+        expected_endpoint = f"{YoutubeAPI.BASE_URL}search"
+        _test_params(monkeypatch, self.api, expected_params, expected_endpoint)
+        self.api.search(**params)
+
+    def test_specialize(self, monkeypatch):
+        api = YoutubeAPI(_DEVELOPER_KEY, caching=False)
+        calls = _count_requests(monkeypatch, api)
+        search = api.specialize(channel_id="UCV73LMcuZQfH5If9JBFb43Q",
+                                order=Order.RATING, search_query="Yoga")
+        search(page_token="next", search_query="")
+        search(duration=VideoDuration.SHORT)
+        api.search(channel_id="UCV73LMcuZQfH5If9JBFb43Q",
+                   order=Order.RATING, page_token="next")
+        api.search(channel_id="UCV73LMcuZQfH5If9JBFb43Q",
+                   order=Order.RATING, search_query="Yoga",
+                   duration=VideoDuration.SHORT)
+        assert calls[0] == calls[2]
+        assert calls[1] == calls[3]
+        with pytest.raises(TypeError, match="search_qeury"):
+            api.specialize(search_qeury="Yoga")
+
+    def test_search_single_result_type(self):
+        api = YoutubeAPI(_DEVELOPER_KEY, caching=False)
+        params = api._search_params(result_type=ResultType.CHANNEL)
+        assert params['type'] == "channel"
+        params = api._search_params(
+                result_type=[ResultType.VIDEO, ResultType.CHANNEL]
+        )
+        assert params['type'] == "video,channel"
+
+    def test_search_params_unknown(self):
+        api = YoutubeAPI(_DEVELOPER_KEY, caching=False)
+        with pytest.raises(TypeError, match="search_qeury"):
+            api._search_params(search_qeury="Yoga")
+
+    def test_http_error(self, monkeypatch):
+        api = YoutubeAPI(_DEVELOPER_KEY, caching=False)
+        monkeypatch.setattr(api._session, "get",
+                            lambda *args, **kwargs: MockForbidden())
+        with pytest.raises(YoutubeAPIException, match="403"):
+            api.search(search_query="py test")
+
+    def test_server_error_after_retries(self, monkeypatch):
+        requests_made = []
+
+        class Unavailable(BaseHTTPRequestHandler):
+            def do_GET(self):
+                requests_made.append(self.path)
+                self.send_response(503)
+                self.end_headers()
+                self.wfile.write(b"backend error")
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), Unavailable)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        api = YoutubeAPI(_DEVELOPER_KEY, caching=False)
+        adapter = api._session.get_adapter("https://")
+        monkeypatch.setattr(adapter.max_retries, "backoff_factor", 0)
+        api._session.mount("http://", adapter)
+        api._endpoints['search'] = f"http://127.0.0.1:{server.server_port}/"
+        try:
+            with pytest.raises(YoutubeAPIException, match="503"):
+                api.search(search_query="py test")
+        finally:
+            server.shutdown()
+            api.close()
+        # first try and 3 retries
+        assert len(requests_made) == 4
+
     def test_channles(self, monkeypatch):
         search_for_ids = ("UCcIvNGMBSQWwo1v3n-ZRBCw",
                           "UCHemJpLUcATaKqDzohNAa6A")
         expected_params = {
                 'part': 'snippet',
-                'maxResults': '50',
+                'maxResults': 50,
                 'id': ','.join(search_for_ids),
                 'key': YOUTUBE_API_KEY}
         expected_endpoint = f"{YoutubeAPI.BASE_URL}channels"
 
-        _test_params(monkeypatch, expected_params, expected_endpoint)
+        _test_params(monkeypatch, self.api, expected_params, expected_endpoint)
         self.api.channels(search_for_ids)
         expected_params = {
                 'part': 'snippet',
-                'maxResults': '5',
+                'maxResults': 5,
                 'id': ','.join(search_for_ids),
                 'pageToken': "ABC",
                 'key': YOUTUBE_API_KEY}
 
-        _test_params(monkeypatch, expected_params, expected_endpoint)
+        _test_params(monkeypatch, self.api, expected_params, expected_endpoint)
         self.api.channels(search_for_ids, max_results=5, page_token="ABC")
 
     def test_videos(self, monkeypatch):
@@ -102,21 +259,21 @@ class TestYoutubeAPI:
 
         expected_params = {
                 'part': 'snippet,contentDetails',
-                'maxResults': '50',
+                'maxResults': 50,
                 'id': ','.join(search_for_ids),
                 'key': YOUTUBE_API_KEY}
 
         expected_endpoint = f"{YoutubeAPI.BASE_URL}videos"
-        _test_params(monkeypatch, expected_params, expected_endpoint)
+        _test_params(monkeypatch, self.api, expected_params, expected_endpoint)
         self.api.videos(search_for_ids)
         expected_params = {
                 'part': 'snippet',
-                'maxResults': '5',
+                'maxResults': 5,
                 'id': ','.join(search_for_ids),
                 'pageToken': "ABC",
                 'key': YOUTUBE_API_KEY}
 
-        _test_params(monkeypatch, expected_params, expected_endpoint)
+        _test_params(monkeypatch, self.api, expected_params, expected_endpoint)
         self.api.videos(search_for_ids, max_results=5, page_token="ABC",
                         part="snippet")
 
@@ -124,11 +281,331 @@ class TestYoutubeAPI:
         videos = self.api.search_all(**search_query['exactly_one'])
         assert len(videos) == 1
 
+    def test_search_iter_prefetch(self, monkeypatch):
+        api = YoutubeAPI(_DEVELOPER_KEY, caching=False)
+        pages = {"": {'items': [1, 2], 'nextPageToken': "B"},
+                 "B": {'items': [3], 'nextPageToken': "C"},
+                 "C": {'items': [4]}}
+        calls = []
+
+        def mock_search(page_token="", **kwargs):
+            calls.append(page_token)
+            return pages[page_token]
+
+        monkeypatch.setattr(api, "search", mock_search)
+        assert list(api.search_iter()) == [1, 2, 3, 4]
+        assert calls == ["", "B", "C"]
+        calls.clear()
+        assert list(api.search_iter(prefetch=True)) == [1, 2, 3, 4]
+        assert calls == ["", "B", "C"]
+        calls.clear()
+        items = api.search_iter(prefetch=True)
+        assert next(items) == 1
+        items.close()
+        # next page was requested in the background
+        assert calls == ["", "B"]
+
     def test_channels_all(self, monkeypatch):
-        pass
+        calls = _mock_ids_request(monkeypatch, self.api, "channels")
+        channel_ids = tuple(f"channel{i}" for i in range(60))
+        channels = self.api.channels_all(channel_ids)
+        assert [c['id'] for c in channels] == list(channel_ids)
+        assert sorted(len(ids) for ids in calls) == [10, 50]
 
     def test_videos_all(self, monkeypatch):
-        pass
+        calls = _mock_ids_request(monkeypatch, self.api, "videos")
+        video_ids = tuple(f"video{i}" for i in range(120))
+        videos = self.api.videos_all(video_ids)
+        assert [v['id'] for v in videos] == list(video_ids)
+        assert sorted(len(ids) for ids in calls) == [20, 50, 50]
+        assert self.api.videos_all(()) == []
+
+    def test_single_chunk_inline(self, monkeypatch):
+        calls = _mock_ids_request(monkeypatch, self.api, "channels")
+        monkeypatch.setattr(video_finder, "ThreadPoolExecutor", None)
+        self.api.channels_all(("a", ))
+        self.api.channels_all(tuple(f"channel{i}" for i in range(50)))
+        self.api.channels_all(f"channel{i}" for i in range(10))
+        assert [len(ids) for ids in calls] == [1, 50, 10]
+
+
+class TestCaching:
+
+    def test_cache_hit(self, monkeypatch, tmp_path):
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        calls = _count_requests(monkeypatch, api)
+        api.search(search_query="py test")
+        api.search(search_query="py test")
+        assert len(calls) == 1
+        # reloaded from file
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        calls = _count_requests(monkeypatch, api)
+        api.search(search_query="py test")
+        assert len(calls) == 0
+
+    def test_memory_hit(self, monkeypatch, tmp_path):
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        _count_requests(monkeypatch, api)
+        api.search(search_query="py test")
+        # served from memory, no hashing or sqlite lookup
+        monkeypatch.setattr(api, "_request_hash", None)
+        monkeypatch.setattr(api._cache, "get", None)
+        assert api.search(search_query="py test")['mock_key']
+        api.close()
+
+    def test_memory_bounded(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(YoutubeAPI, "MEMORY_SIZE", 2)
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        calls = _count_requests(monkeypatch, api)
+        for query in ("a", "b", "c", "a"):
+            api.search(search_query=query)
+        assert len(api._memory) == 2
+        # "a" was dropped from memory, but is still in the sqlite cache
+        assert len(calls) == 3
+        api.close()
+
+    def test_cache_revalidate_etag(self, monkeypatch, tmp_path):
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path),
+                         caching_delay=timedelta(seconds=0))
+        calls = _count_requests(monkeypatch, api)
+        first = api.search(search_query="py test")
+        # expired, revalidated with If-None-Match -> 304
+        assert api.search(search_query="py test") == first
+        assert len(calls) == 2
+        # not in memory, revalidated from the sqlite cache
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path),
+                         caching_delay=timedelta(seconds=0))
+        calls = _count_requests(monkeypatch, api)
+        assert api.search(search_query="py test") == first
+        assert len(calls) == 1
+
+    def test_dump_dir_created_lazily(self, monkeypatch, tmp_path):
+        dump_dir = tmp_path / "cache" / "nested"
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(dump_dir))
+        assert not dump_dir.exists()
+        _count_requests(monkeypatch, api)
+        api.search(search_query="py test")
+        assert dump_dir.is_dir()
+
+    def test_purge(self, monkeypatch, tmp_path):
+        cache_file = str(tmp_path / YoutubeAPI.DUMP_FILE_NAME)
+        cache = RequestCache(cache_file)
+        old = time.time() - timedelta(days=2).total_seconds()
+        cache.put(b"expired", old, {'items': []})
+        cache.put(b"etag", old, {'items': [], 'etag': "abc"})
+        cache.close()
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        api.close()
+        cache = RequestCache(cache_file)
+        assert cache.get(b"expired") is None
+        # kept for revalidation
+        assert cache.get(b"etag") == (old, "abc",
+                                      {'items': [], 'etag': "abc"})
+        cache.close()
+
+    def test_compressed_body(self, tmp_path):
+        cache_file = str(tmp_path / YoutubeAPI.DUMP_FILE_NAME)
+        response = _load_response("search")
+        cache = RequestCache(cache_file)
+        cache.put(b"search", time.time(), response)
+        cache.close()
+        with sqlite3.connect(cache_file) as db:
+            body, = db.execute("SELECT body FROM cache").fetchone()
+        assert len(body) < len(json.dumps(response)) / 2
+        assert RequestCache(cache_file).get(b"search")[2] == response
+
+    def test_old_cache_version_dropped(self, tmp_path):
+        cache_file = str(tmp_path / YoutubeAPI.DUMP_FILE_NAME)
+        with sqlite3.connect(cache_file) as db:
+            db.execute("CREATE TABLE cache(h BLOB PRIMARY KEY, t TEXT, "
+                       "etag TEXT, body BLOB)")
+            db.execute("INSERT INTO cache VALUES (?, ?, '', ?)",
+                       (b"search", str(datetime.now()), b"{}"))
+        assert RequestCache(cache_file).get(b"search") is None
+
+    def test_cache_key_collision(self, monkeypatch, tmp_path):
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        calls = _count_requests(monkeypatch, api)
+        api._request("search", {'q': "a,b:c"})
+        api._request("search", {'q': "a", 'b': "c"})
+        assert len(calls) == 2
+
+    def test_inflight_requests_coalesced(self, monkeypatch, tmp_path):
+        api = YoutubeAPI(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        calls = []
+
+        def mock_get(*args, **kwargs):
+            calls.append(kwargs['params'])
+            time.sleep(0.2)
+            return MockResponse()
+
+        monkeypatch.setattr(api._session, "get", mock_get)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            responses = list(executor.map(
+                    lambda _: api.search(search_query="py test"), range(4)
+            ))
+        assert len(calls) == 1
+        assert all(response is responses[0] for response in responses)
+        assert api._inflight == {}
+        api.close()
+
+
+class TestResponseAdapter:
+
+    def test_search_video(self):
+        item = _load_response("search")['items'][0]
+        video = YoutubeVideo(item)
+        assert video.video_id == "B2Yv6arlsIA"
+        assert video.title == item['snippet']['title']
+        assert video.url.endswith("B2Yv6arlsIA")
+        assert video.raw is item
+        assert not hasattr(video, "__dict__")
+        with pytest.raises(AttributeError):
+            video.duration
+
+    def test_details_video(self):
+        item = _load_response("videos")['items'][0]
+        video = YoutubeVideo(item)
+        assert video.video_id == "B2Yv6arlsIA"
+        assert video.duration == item['contentDetails']['duration']
+        assert video.dimension == "2d"
+        # must not change how search results are read
+        search_item = _load_response("search")['items'][1]
+        assert YoutubeVideo(search_item).video_id == "TMTMtmcfrgA"
+        # fields are shared by all instances, read only
+        with pytest.raises(TypeError):
+            YoutubeVideo.fields['video_id'] = ('id', )
+
+    def test_channel(self):
+        item = _load_response("channels")['items'][0]
+        channel = YoutubeChannel(item)
+        assert channel.channel_id == "UCHemJpLUcATaKqDzohNAa6A"
+        assert channel.title == "Roh Vegan am Limit"
+        assert not hasattr(channel, "__dict__")
+
+
+class TestYoutubeFinderRequests:
+
+    def test_close(self, monkeypatch, tmp_path):
+        with YoutubeFinder(_DEVELOPER_KEY, dump_dir=str(tmp_path)) as finder:
+            _count_requests(monkeypatch, finder._api)
+            finder._api.search(search_query="py test")
+            assert finder._api._cache._db is not None
+        assert finder._api._cache._db is None
+
+    def test_search_videos_fields(self, monkeypatch):
+        finder = YoutubeFinder(_DEVELOPER_KEY, caching=False)
+        response = _load_response("search")
+        del response['nextPageToken']
+        calls = []
+
+        def mock_get(*args, **kwargs):
+            calls.append(kwargs['params'])
+            return MockFixtureResponse(response)
+
+        monkeypatch.setattr(finder._api._session, "get", mock_get)
+        videos = finder.search_videos(search_query="THE CREW2")
+        assert len(videos) == 50
+        assert videos[0].video_id == "B2Yv6arlsIA"
+        assert [c['fields'] for c in calls] == [YoutubeFinder.SEARCH_FIELDS]
+
+    def test_search_videos_max_results(self, monkeypatch):
+        finder = YoutubeFinder(_DEVELOPER_KEY, caching=False)
+        # every page has a nextPageToken, paging has to stop on its own
+        response = _load_response("search")
+        calls = []
+
+        def mock_get(*args, **kwargs):
+            calls.append(kwargs['params'])
+            return MockFixtureResponse(response)
+
+        monkeypatch.setattr(finder._api._session, "get", mock_get)
+        videos = finder.search_videos(search_query="THE CREW2",
+                                      max_results=60)
+        assert len(videos) == 60
+        assert len(calls) == 2
+        calls.clear()
+        assert len(finder.search_videos(max_results=10)) == 10
+        assert [c['maxResults'] for c in calls] == [10]
+
+    def test_search_videos_details_overlap(self, monkeypatch):
+        finder = YoutubeFinder(_DEVELOPER_KEY, caching=False)
+        first_chunk = threading.Event()
+        pages = [{'items': [{'id': {'videoId': f"{page}-{i}"}}
+                            for i in range(50)]}
+                 for page in range(2)]
+        pages[0]['nextPageToken'] = "next"
+
+        def mock_search(**params):
+            if not params.get('page_token'):
+                return pages[0]
+            # /videos of the first page runs while paging on
+            assert first_chunk.wait(timeout=2)
+            return pages[1]
+
+        def mock_videos(ids, part="", fields=""):
+            first_chunk.set()
+            return {'items': [{'kind': "youtube#video", 'id': i}
+                              for i in ids]}
+
+        monkeypatch.setattr(finder._api, "search", mock_search)
+        monkeypatch.setattr(finder._api, "videos", mock_videos)
+        videos = finder.search_videos(content_details=True)
+        assert [v.video_id for v in videos] == \
+            [item['id']['videoId'] for page in pages for item in page['items']]
+
+    def test_get_channels_fields(self, monkeypatch):
+        finder = YoutubeFinder(_DEVELOPER_KEY, caching=False)
+        response = _load_response("channels")
+        calls = []
+
+        def mock_get(*args, **kwargs):
+            calls.append(kwargs['params'])
+            return MockFixtureResponse(response)
+
+        monkeypatch.setattr(finder._api._session, "get", mock_get)
+        finder.get_channel("UCHemJpLUcATaKqDzohNAa6A")
+        # every requested part is kept by the selector
+        for part in calls[0]['part'].split(','):
+            assert part in calls[0]['fields']
+
+    def test_get_channels_memoized(self, monkeypatch, tmp_path):
+        finder = YoutubeFinder(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        calls = _channels_requests(monkeypatch, finder._api)
+        first = finder.get_channel("UCHemJpLUcATaKqDzohNAa6A")
+        # served from the api memory, same adapter
+        assert finder.get_channel("UCHemJpLUcATaKqDzohNAa6A") is first
+        assert len(calls) == 1
+
+    def test_get_channels_memo_expired(self, monkeypatch, tmp_path):
+        finder = YoutubeFinder(_DEVELOPER_KEY, dump_dir=str(tmp_path),
+                               caching_delay=timedelta(seconds=0))
+        calls = _channels_requests(monkeypatch, finder._api)
+        first = finder.get_channel("UCHemJpLUcATaKqDzohNAa6A")
+        # cached response expired, a new response gets a new adapter
+        assert finder.get_channel("UCHemJpLUcATaKqDzohNAa6A") is not first
+        assert len(calls) == 2
+
+    def test_get_channels_memo_bounded(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(YoutubeAPI, "MEMORY_SIZE", 2)
+        finder = YoutubeFinder(_DEVELOPER_KEY, dump_dir=str(tmp_path))
+        _mock_ids_request(monkeypatch, finder._api, "channels")
+        finder.get_channels(("a", "b", "c"))
+        assert list(finder._channels) == ["b", "c"]
+
+    def test_search_videos_columns(self, monkeypatch):
+        finder = YoutubeFinder(_DEVELOPER_KEY, caching=False)
+        response = _load_response("search")
+        del response['nextPageToken']
+        monkeypatch.setattr(finder._api._session, "get",
+                            lambda *args, **kwargs:
+                            MockFixtureResponse(response))
+        columns = finder.search_videos_columns(search_query="THE CREW2")
+        videos = finder.search_videos(search_query="THE CREW2")
+        assert set(columns) == set(YoutubeVideo.fields)
+        assert columns['video_id'] == [v.video_id for v in videos]
+        # not in search responses
+        assert columns['duration'] == [None] * len(videos)
 
 
 class TestYoutubeFinder:
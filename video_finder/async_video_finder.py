@@ -0,0 +1,235 @@
+import asyncio
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Tuple, AsyncIterator
+
+try:
+    import aiohttp
+except ImportError:  # optional dependency, pip install video-finder[async]
+    aiohttp = None
+
+from video_finder.video_finder import YoutubeAPI, YoutubeFinder
+from video_finder.video_finder import YoutubeAPIException
+from video_finder.video_finder import YoutubeVideo, YoutubeChannel
+from video_finder.video_finder import Order, EventType, VideoDuration
+from video_finder.video_finder import VideoCaption, VideoEmbeddable
+from video_finder.video_finder import VideoDefinition
+from video_finder.video_finder import _json_loads, _batched
+
+__all__ = ["AsyncYoutubeAPI", "AsyncYoutubeFinder"]
+
+
+class AsyncYoutubeAPI(YoutubeAPI):
+    """ asyncio version of YoutubeAPI, needs aiohttp.
+        search, channels and videos return coroutines, the *_all methods
+        fetch independent id chunks concurrently.
+        Caching is not supported.
+    """
+
+    def __init__(self, developer_key, logger=None, limit=32):
+        if aiohttp is None:
+            raise ImportError("AsyncYoutubeAPI needs aiohttp installed.")
+        self._limit = limit
+        super().__init__(developer_key, logger=logger, caching=False)
+
+    def _create_session(self):
+        # aiohttp wants a running event loop, session is created on first use
+        return None
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self._limit,
+                                             ttl_dns_cache=300)
+            connect, read = self.TIMEOUT
+            timeout = aiohttp.ClientTimeout(sock_connect=connect,
+                                            sock_read=read)
+            self._session = aiohttp.ClientSession(
+                    connector=connector, timeout=timeout,
+                    headers={'User-Agent': self.USER_AGENT}
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+
+    def __enter__(self):
+        # the sync __exit__ could not await close()
+        raise TypeError("use 'async with' for AsyncYoutubeAPI")
+
+    def __exit__(self, *args):
+        raise TypeError("use 'async with' for AsyncYoutubeAPI")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def _request(self, method="search",
+                       params=dict()) -> Dict[str, Any]:
+        session = self._get_session()
+        url = self._endpoints.get(method) or self.BASE_URL + method
+        # yarl converts int values itself
+        async with session.get(url,
+                               params={**params,
+                                       'key': self._developer_key}
+                               ) as response:
+            self._logger.info("request url: %s" % response.url)
+            if not response.ok:
+                text = await response.text()
+                raise YoutubeAPIException(f"{response.status}: {text[:200]}")
+            response_dict = _json_loads(await response.read())
+        self._check_for_errors(response_dict)
+        return response_dict
+
+    async def search_all(self, **search_params) -> List[Dict[str, Any]]:
+        """ async version of YoutubeAPI.search_all, takes the same params.
+            pages depend on each other (nextPageToken), they are fetched
+            one after another.
+        """
+        self._logger.info("Fetching ALL videos data from youtube.")
+        videos = [item async for item in self.search_iter(**search_params)]
+        self._logger.info(
+                "Fetched ALL (%i) videos from youtube." % len(videos)
+        )
+        return videos
+
+    async def search_iter(self,
+                          **search_params) -> AsyncIterator[Dict[str, Any]]:
+        """ async version of YoutubeAPI.search_iter, takes the same params.
+        """
+        yt_response = await self.search(**search_params)
+        while yt_response.get('items'):
+            for item in yt_response['items']:
+                yield item
+            page_token = yt_response.get('nextPageToken')
+            if not page_token:
+                # got all pages, no next page
+                break
+            search_params['page_token'] = page_token
+            yt_response = await self.search(**search_params)
+
+    async def _gather_chunks(self, request, ids, part,
+                             fields="") -> List[Dict]:
+        responses = await asyncio.gather(
+                *[request(chunk, part=part, fields=fields)
+                  for chunk in _batched(ids, 50)]
+        )
+        return [item for response in responses
+                for item in response.get('items', [])]
+
+    async def channels_all(self, channel_ids: Tuple[str] = (),
+                           part="snippet,contentDetails",
+                           fields="") -> List[Dict]:
+        """ async version of YoutubeAPI.channels_all.
+            all chunks of 50 ids are requested concurrently.
+        """
+        return await self._gather_chunks(self.channels, channel_ids, part,
+                                         fields)
+
+    async def videos_all(self, video_ids: Tuple[str] = (),
+                         part="snippet,contentDetails",
+                         fields="") -> List[Dict]:
+        """ async version of YoutubeAPI.videos_all.
+            all chunks of 50 ids are requested concurrently.
+        """
+        return await self._gather_chunks(self.videos, video_ids, part,
+                                         fields)
+
+
+class AsyncYoutubeFinder(YoutubeFinder):
+    """ asyncio version of YoutubeFinder, needs aiohttp. """
+
+    def __init__(self, developer_key, logger=None, limit=32):
+        self._logger = logger if logger else logging.getLogger(__name__)
+        self._api = AsyncYoutubeAPI(developer_key, logger=self._logger,
+                                    limit=limit)
+
+    async def close(self):
+        await self._api.close()
+
+    def __enter__(self):
+        # the sync __exit__ could not await close()
+        raise TypeError("use 'async with' for AsyncYoutubeFinder")
+
+    def __exit__(self, *args):
+        raise TypeError("use 'async with' for AsyncYoutubeFinder")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    async def get_channels(self, channel_ids: Tuple[str] = ()
+                           ) -> List[YoutubeChannel]:
+        items = await self._api.channels_all(channel_ids,
+                                             fields=self.CHANNELS_FIELDS)
+        return list(map(YoutubeChannel, items))
+
+    async def get_channel(self, channel_id: str) -> YoutubeChannel:
+        return (await self.get_channels((channel_id, )))[0]
+
+    async def search_videos(self, content_details=False,
+                            # search params
+                            channel_id: str = "",
+                            search_query: str = "",
+                            order: Order = Order.DATE,
+                            published_after: datetime = None,
+                            published_before: datetime = None,
+                            relevance_language: str = "",
+                            event_type: EventType = None,
+                            duration: VideoDuration = None,
+                            caption: VideoCaption = None,
+                            embeddable: VideoEmbeddable = None,
+                            definition: VideoDefinition = None,
+                            related_to_video_id: str = "",
+                            max_results: int = None) -> List[YoutubeVideo]:
+        """ async version of YoutubeFinder.search_videos, takes the same
+            params. contentDetails are fetched concurrently in chunks.
+        """
+        response_items = await self._search_items(
+                content_details, max_results,
+                channel_id=channel_id, search_query=search_query,
+                order=order, published_before=published_before,
+                published_after=published_after,
+                relevance_language=relevance_language,
+                event_type=event_type, duration=duration,
+                caption=caption, embeddable=embeddable,
+                definition=definition,
+                related_to_video_id=related_to_video_id
+        )
+        return list(map(YoutubeVideo, response_items))
+
+    async def search_videos_columns(self, content_details=False,
+                                    max_results=None,
+                                    **search_params) -> Dict[str, list]:
+        """ async version of YoutubeFinder.search_videos_columns. """
+        response_items = await self._search_items(content_details,
+                                                  max_results, **search_params)
+        return YoutubeVideo.columns(response_items)
+
+    async def _search_items(self, content_details, max_results,
+                            **search_params) -> List[Dict[str, Any]]:
+        part = "id" if content_details else "snippet"
+        fields = self.SEARCH_ID_FIELDS if content_details \
+            else self.SEARCH_FIELDS
+        page_size = min(max_results, 50) if max_results else 50
+        response_items = []
+        if max_results == 0:
+            # same as islice(..., 0), nothing is requested
+            return response_items
+        async for item in self._api.search_iter(part=part, fields=fields,
+                                                max_results=page_size,
+                                                **search_params):
+            response_items.append(item)
+            if len(response_items) == max_results:
+                break
+        if content_details:  # get addtional video data (contentDetails)
+            video_ids = [v['id']['videoId'] for v in response_items]
+            self._logger.info(f"get contentDetails for {video_ids}")
+            response_items = await self._api.videos_all(
+                    video_ids=video_ids, fields=self.VIDEOS_FIELDS
+            )
+        return response_items
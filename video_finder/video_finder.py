@@ -1,19 +1,69 @@
 import os
 import json
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 import hashlib
+import sqlite3
+import time
+import zlib
 import logging
-from typing import List, Dict, Any, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from functools import lru_cache
+from itertools import islice, chain
+from typing import List, Dict, Any, Tuple, Iterator, Mapping, Sized
+from types import MappingProxyType
 from enum import Enum
 from datetime import datetime
 from datetime import timedelta
+from video_finder import __version__
+
+try:
+    import orjson
+except ImportError:  # optional dependency, faster json (de)serialization
+    orjson = None
 
 __all__ = ["VideoDuration", "ResultType", "VideoEmbeddable", "VideoCaption",
            "VideoDefinition", "Order", "EventType", "YoutubeAPI",
            "YoutubeVideo", "YoutubeChannel", "YoutubeFinder"]
 
 
-class ResultType(Enum):
+def _json_loads(data: bytes) -> Any:
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
+def _batched(iterable, n):
+    """ yields tuples of n items, the last one may be shorter. """
+    it = iter(iterable)
+    batch = tuple(islice(it, n))
+    while batch:
+        yield batch
+        batch = tuple(islice(it, n))
+
+
+class _ParamEnum(str, Enum):
+    """ enum of request param values. members are str, str() and format()
+        give the value, so http clients (requests, aiohttp/yarl) send it.
+    """
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __format__(self, format_spec) -> str:
+        return self.value.__format__(format_spec)
+
+
+class ResultType(_ParamEnum):
     """ The type parameter restricts a search query to only retrieve a
         particular type of resource.
     """
@@ -22,7 +72,7 @@ class ResultType(Enum):
     VIDEO = "video"
 
 
-class Order(Enum):
+class Order(_ParamEnum):
     DATE = "date"
     RATING = "rating"
     RELEVANCE = "relevance"
@@ -31,7 +81,7 @@ class Order(Enum):
     VIEWCOUNT = "viewCount"
 
 
-class VideoDuration(Enum):
+class VideoDuration(_ParamEnum):
     """ The videoDuration parameter filters video search results based on their
         duration. If you specify a value for this parameter, you must also set
         the type parameter's value to video.
@@ -42,7 +92,7 @@ class VideoDuration(Enum):
     SHORT = "short"  # videos less than 4 mins.
 
 
-class VideoEmbeddable(Enum):
+class VideoEmbeddable(_ParamEnum):
     """ The videoEmbeddable parameter lets you to restrict a search to only
         videos that can be embedded into a webpage. If you specify a value
         for this parameter, you must also set the type parameter's value to
@@ -52,7 +102,7 @@ class VideoEmbeddable(Enum):
     TRUE = "true"
 
 
-class VideoCaption(Enum):
+class VideoCaption(_ParamEnum):
     """ The videoCaption parameter indicates whether the API should filter
         video search results based on whether they have captions. If you
         specify a value for this parameter, you must also set the type
@@ -63,102 +113,308 @@ class VideoCaption(Enum):
     NONE = "none"  # videos that do not have caption
 
 
-class VideoDefinition(Enum):
+class VideoDefinition(_ParamEnum):
     ANY = "any"
     HIGH = "high"
     STANDARD = "standard"
 
 
-class EventType(Enum):
+class EventType(_ParamEnum):
     COMPLETED = "completed"
     LIVE = "live"
     UPCOMING = "upcoming"
 
 
+@lru_cache(maxsize=64)
+def _join_types(result_type: Tuple[ResultType, ...]) -> str:
+    # enums are str subclasses, no .value needed
+    return ','.join(result_type)
+
+
+def _isoformat(date: datetime) -> str:
+    return date.astimezone().isoformat()
+
+
+# optional /search params: (youtube name, search argument, conversion)
+_SEARCH_PARAMS = (
+        ('q', 'search_query', None),
+        ('channelId', 'channel_id', None),
+        ('publishedBefore', 'published_before', _isoformat),
+        ('publishedAfter', 'published_after', _isoformat),
+        ('relevanceLanguage', 'relevance_language', None),
+        ('pageToken', 'page_token', None),
+        ('eventType', 'event_type', None),
+        ('videoDuration', 'duration', None),
+        ('videoCaption', 'caption', None),
+        ('videoEmbeddable', 'embeddable', None),
+        ('videoDefinition', 'definition', None),
+        ('relatedToVideoId', 'related_to_video_id', None),
+        ('fields', 'fields', None),
+)
+# search argument -> youtube name, for values passed as they are
+_PLAIN_SEARCH_PARAMS = {argument: name
+                        for name, argument, convert in _SEARCH_PARAMS
+                        if convert is None}
+
+
 class YoutubeAPIException(Exception):
     def __init__(self, response):
-        super().__init__(response['error']['message'])
+        # youtube error response or plain message
+        if isinstance(response, dict):
+            response = response['error']['message']
+        super().__init__(response)
+
+
+class RequestCache:
+    """ persistent request cache, a sqlite table
+        request hash -> (time, etag, response).
+        time is the unix timestamp the response was cached at,
+        response bodies are stored zlib compressed json.
+        responses are only loaded when requested.
+    """
+    # bump on changes of the table layout, old caches are dropped
+    VERSION = 2
+
+    def __init__(self, path):
+        self._path = path
+        self._db = None
+        # *_all requests use the cache from worker threads
+        self._lock = threading.Lock()
+
+    def _connect(self, create=False) -> sqlite3.Connection:
+        # nothing touches the filesystem before the first write
+        if self._db is None:
+            if not create and not os.path.isfile(self._path):
+                return None
+            os.makedirs(os.path.dirname(self._path), exist_ok=True)
+            self._db = sqlite3.connect(self._path, check_same_thread=False)
+            with self._db:
+                version, = self._db.execute("PRAGMA user_version").fetchone()
+                if version != self.VERSION:
+                    self._db.execute("DROP TABLE IF EXISTS cache")
+                    self._db.execute(f"PRAGMA user_version = {self.VERSION}")
+                self._db.execute("CREATE TABLE IF NOT EXISTS cache(h BLOB "
+                                 "PRIMARY KEY, t REAL, etag TEXT, body BLOB)")
+        return self._db
+
+    def get(self,
+            request_hash: bytes) -> Tuple[float, str, Dict[str, Any]]:
+        """ returns (time, etag, response) or None if not cached. """
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return None
+            row = db.execute("SELECT t, etag, body FROM cache WHERE h = ?",
+                             (request_hash, )).fetchone()
+        if row is None:
+            return None
+        cached_at, etag, body = row
+        return cached_at, etag, _json_loads(zlib.decompress(body))
+
+    def put(self, request_hash: bytes, cached_at: float,
+            response: Dict[str, Any]):
+        # repeated keys and urls, json shrinks to a fraction
+        body = zlib.compress(_json_dumps(response), 6)
+        with self._lock:
+            db = self._connect(create=True)
+            with db:  # commit, in case of sudden termination of the script
+                db.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?)",
+                           (request_hash, cached_at, response.get('etag', ""),
+                            body))
+
+    def touch(self, request_hash: bytes, cached_at: float):
+        """ mark a cached response as fresh, ie. after 304 Not Modified. """
+        with self._lock:
+            db = self._connect(create=True)
+            with db:
+                db.execute("UPDATE cache SET t = ? WHERE h = ?",
+                           (cached_at, request_hash))
+
+    def purge(self, expired: float, stale: float):
+        """ delete responses cached before expired, responses with an etag
+            are kept until stale.
+        """
+        with self._lock:
+            db = self._connect()
+            if db is None:
+                return
+            with db:
+                db.execute("DELETE FROM cache WHERE t < ? "
+                           "AND (etag = '' OR t < ?)", (expired, stale))
+
+    def close(self):
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
 
 
 class YoutubeAPI:
     BASE_URL = "https://www.googleapis.com/youtube/v3/"
-    DUMP_FILE_NAME = ".request_cache.json"
+    DUMP_FILE_NAME = ".request_cache.sqlite"
     DUMP_DIR = "."
+    # parallel requests in channels_all/videos_all
+    MAX_WORKERS = 8
+    # expired responses are kept this long to revalidate them by etag
+    STALE_DELAY = timedelta(days=30)
+    # responses kept in memory, oldest are dropped first
+    MEMORY_SIZE = 2048
+    # (connect, read) timeout in seconds
+    TIMEOUT = (3.05, 30)
+    USER_AGENT = f"simple-youtube-video-finder/{__version__}"
 
     def __init__(self, developer_key, dump_dir=".", logger=None, caching=True,
                  caching_delay=timedelta(days=1.0)):
         self._developer_key = developer_key
         self._logger = logger if logger else logging.getLogger(__name__)
+        self._session = self._create_session()
+        self._endpoints = {method: self.BASE_URL + method
+                           for method in ("search", "channels", "videos")}
+        self._caching = caching
         if caching:
             if not dump_dir:
                 dump_dir = self.DUMP_DIR
-            try:
-                os.mkdir(dump_dir)
-            except FileExistsError:
-                pass
-            self._expires = caching_delay
-            self._cache_file = "%s/%s" % (os.path.abspath(dump_dir),
-                                          self.DUMP_FILE_NAME)
-            # Load cache from file
-            cache = {}
-            if os.path.isfile(self._cache_file):
-                with open(self._cache_file, 'r') as f:
-                    cached_requests = json.load(f)
-                    for request_hash, (time_str, response) \
-                            in cached_requests.items():
-                        time = datetime.fromisoformat(time_str)
-                        if datetime.now() - time < self._expires:
-                            cache[request_hash] = (time_str, response)
-            self._cache = cache
-            self._request = self._cached_request(self._request)
-
-    def _cached_request(self, func):
-        def do_caching(method="", params={}):
-            # generate hash of the request, used as identifier
-            param_str_list = [f"{key}:{value}"
-                              for key, value in params.items()]
-            to_hash = (method+','.join(param_str_list)).encode("utf-8")
-            self._logger.debug(f"Create hash from {to_hash}")
-            request_hash = hashlib.sha224(to_hash).hexdigest()
-            # ? is request cached
-            if request_hash in self._cache.keys():
-                time_str, response_json = self._cache[request_hash]
-                # only use not expired requests
-                time = datetime.fromisoformat(time_str)
-                if datetime.now() - time < self._expires:
-                    self._logger.info(f"Loading request {request_hash}")
-                    return response_json
-                else:
-                    self._logger.debug(f"Expired request {request_hash}")
-            # response not cached!
-            response_json = func(method, params)
-            # cache it
-            self._logger.info(f"Caching request {request_hash}")
-            self._cache[request_hash] = (str(datetime.now()), response_json)
-            # write to file, in case of sudden termination of the script
-            # __del__ not relyable!
-            with open(self._cache_file, 'w') as f:
-                json.dump(self._cache, f)
-            return response_json
-        return do_caching
+            # created on first cache write
+            self._dump_dir = os.path.abspath(dump_dir)
+            self._expires = caching_delay.total_seconds()
+            self._cache_file = "%s/%s" % (self._dump_dir, self.DUMP_FILE_NAME)
+            self._cache = RequestCache(self._cache_file)
+            self._memory: Dict[Tuple, Tuple[float, str, Dict]] = {}
+            self._memory_lock = threading.Lock()
+            # identical requests running concurrently share one response
+            self._inflight: Dict[Tuple, Future] = {}
+            self._inflight_lock = threading.Lock()
+            expired = time.time() - self._expires
+            self._cache.purge(expired,
+                              expired - self.STALE_DELAY.total_seconds())
+
+    def _create_session(self) -> requests.Session:
+        # reuse connections to googleapis.com, saves the tcp/tls handshake
+        session = requests.Session()
+        # the last 5xx response is returned, _http_get raises for it
+        retries = Retry(total=3, backoff_factor=0.2,
+                        status_forcelist=[500, 502, 503, 504],
+                        raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32,
+                              max_retries=retries)
+        session.mount("https://", adapter)
+        # disable proxy for faster response
+        session.trust_env = False
+        # compressed responses, br only if brotli is installed
+        session.headers.update({
+            'Accept-Encoding':
+                make_headers(accept_encoding=True)['accept-encoding'],
+            'User-Agent': self.USER_AGENT,
+        })
+        return session
+
+    def close(self):
+        if self._caching:
+            self._cache.close()
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _request_hash(self, method, params) -> bytes:
+        # identifier of the request in the persistent cache.
+        # canonical json: keys sorted, no separator collisions
+        to_hash = json.dumps([method, params], sort_keys=True,
+                             separators=(',', ':')).encode("utf-8")
+        self._logger.debug(f"Create hash from {to_hash}")
+        return hashlib.blake2b(to_hash, digest_size=16).digest()
 
     def _check_for_errors(self, response):
-        if 'error' in response.keys():
+        if 'error' in response:
             raise YoutubeAPIException(response)
 
     def _request(self, method="search", params=dict()) -> Dict[str, Any]:
-        # some search params maybe int ...
-        params = {str(key): str(value) for key, value in params.items()}
-        request_params = {
-                **params,
-                'key': self._developer_key,
-        }
-        # disable proxy for faster response
-        proxies = {"http": None, "https": None}
-        response = requests.get("%s%s" % (self.BASE_URL, method),
-                                params=request_params, proxies=proxies)
+        if not self._caching:
+            return self._http_get(method, params)
+        # responses of this run are kept in memory, keyed without hashing
+        key = (method, tuple(sorted(params.items())))
+        request_hash = None
+        # ? is request cached
+        cached = self._memory.get(key)
+        if cached is None:
+            request_hash = self._request_hash(method, params)
+            cached = self._cache.get(request_hash)
+        etag = ""
+        if cached is not None:
+            cached_at, etag, cached_json = cached
+            # only use not expired requests
+            if time.time() - cached_at < self._expires:
+                self._logger.info(f"Loading request {method} {key[1]}")
+                self._remember(key, cached)
+                return cached_json
+            # revalidate, youtube answers 304 if unchanged
+            self._logger.debug(f"Expired request {method} {key[1]}")
+        with self._inflight_lock:
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                future = self._inflight[key] = Future()
+        if inflight is not None:
+            # same request is already running, wait for its response
+            self._logger.debug(f"Waiting for request {method} {key[1]}")
+            return inflight.result()
+        try:
+            response_json = self._http_get(method, params, etag=etag)
+            if request_hash is None:
+                request_hash = self._request_hash(method, params)
+            cached_at = time.time()
+            if response_json is None:
+                self._logger.info(f"Not modified request {method} {key[1]}")
+                # only the time changes, body stays in the cache as it is
+                self._remember(key, (cached_at, etag, cached_json))
+                self._cache.touch(request_hash, cached_at)
+                response_json = cached_json
+            else:
+                # cache it
+                self._logger.info(f"Caching request {request_hash.hex()}")
+                self._remember(key, (cached_at, response_json.get('etag', ""),
+                                     response_json))
+                self._cache.put(request_hash, cached_at, response_json)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response_json)
+            return response_json
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _remember(self, key, entry):
+        # bounded fifo, the sqlite cache still has the dropped responses
+        with self._memory_lock:
+            if key not in self._memory and \
+                    len(self._memory) >= self.MEMORY_SIZE:
+                del self._memory[next(iter(self._memory))]
+            self._memory[key] = entry
+
+    def _http_get(self, method="search", params=dict(),
+                  etag="") -> Dict[str, Any]:
+        """ returns None if etag is given and the response is unchanged
+            (304 Not Modified).
+        """
+        headers = {'If-None-Match': etag} if etag else None
+        url = self._endpoints.get(method) or self.BASE_URL + method
+        # requests converts int values itself
+        response = self._session.get(url,
+                                     params={**params,
+                                             'key': self._developer_key},
+                                     headers=headers, timeout=self.TIMEOUT)
         self._logger.info("request url: %s" % response.url)
-        response_dict = response.json()
+        if response.status_code == 304:
+            return None
+        if not response.ok:
+            raise YoutubeAPIException(
+                    f"{response.status_code}: {response.text[:200]}"
+            )
+        response_dict = _json_loads(response.content)
         self._check_for_errors(response_dict)
         return response_dict
 
@@ -179,7 +435,8 @@ class YoutubeAPI:
                caption: VideoCaption = None,
                embeddable: VideoEmbeddable = None,
                definition: VideoDefinition = None,
-               related_to_video_id: str = "") -> Dict[str, Any]:
+               related_to_video_id: str = "",
+               fields: str = "") -> Dict[str, Any]:
         """ make /search request to www.googleapis.com/youtube/v3.
             Args:
                 channel_id (str): channel to search in.
@@ -206,52 +463,75 @@ class YoutubeAPI:
                 related_to_video_id (str): The relatedToVideoId parameter
                     retrieves a list of videos that are related to the video
                     that the parameter value identifies.
+                fields (str): partial response, only returns the selected
+                    fields (ie: "nextPageToken,items(id/videoId)"), see
+                    youtube api documentation: "getting-started#fields".
             Returns:
                 dict:
                     youtube response, see
                     https://developers.google.com/youtube/v3/docs/search/list#response
         """
-
+        return self._request("search", self._search_params(
+                channel_id=channel_id, search_query=search_query,
+                order=order, max_results=max_results,
+                published_after=published_after,
+                published_before=published_before,
+                relevance_language=relevance_language,
+                result_type=result_type, part=part, page_token=page_token,
+                event_type=event_type, duration=duration, caption=caption,
+                embeddable=embeddable, definition=definition,
+                related_to_video_id=related_to_video_id, fields=fields
+        ))
+
+    def _search_params(self, order: Order = Order.DATE, max_results: int = 50,
+                       result_type: List[ResultType] = (ResultType.VIDEO,),
+                       part='snippet', **optional) -> Dict[str, Any]:
+        # params of a /search request, optional takes the search arguments
+        # of _SEARCH_PARAMS
         params = {
                 'part': part,
-                'order': order.value,
+                'order': order,
                 'maxResults': max_results,
-                'type': ','.join(map(lambda e: e.value, result_type)),
+                'type': _join_types(
+                        # a single ResultType is a str, not a list of types
+                        (result_type, ) if isinstance(result_type, str)
+                        else tuple(result_type)
+                ),
         }
-
-        if search_query:
-            params.update({'q': search_query})
-        if channel_id:
-            params.update({'channelId': channel_id})
-        if published_before:
-            published_before_tz = published_before.astimezone()
-            before_rfc3339 = published_before_tz.isoformat()
-            params.update({'publishedBefore': before_rfc3339})
-        if published_after:
-            published_after_tz = published_after.astimezone()
-            after_rfc3339 = published_after_tz.isoformat()
-            params.update({'publishedAfter': after_rfc3339})
-        if relevance_language:
-            params.update({'relevanceLanguage': relevance_language})
-        if page_token:
-            params.update({'pageToken': page_token})
-        if event_type:
-            params.update({'eventType': event_type.value})
-        if duration:
-            params.update({'videoDuration': duration.value})
-        if caption:
-            params.update({'videoCaption': caption.value})
-        if embeddable:
-            params.update({'videoEmbeddable': embeddable.value})
-        if definition:
-            params.update({'videoDefinition': definition.value})
-        if related_to_video_id:
-            params.update({'relatedToVideoId': related_to_video_id})
-
-        return self._request("search", params)
+        for name, argument, convert in _SEARCH_PARAMS:
+            value = optional.pop(argument, None)
+            if value:
+                params[name] = convert(value) if convert else value
+        if optional:
+            raise TypeError(f"unknown search params: {', '.join(optional)}")
+        return params
+
+    def specialize(self, **defaults):
+        """ search with fixed params, ie. one channel ordered by date.
+            the params of the defaults are built once, the returned function
+            takes the same params as search and only builds the changed ones.
+            Args:
+                **defaults: params of search.
+            Returns:
+                function: search(**params) -> dict (youtube response).
+        """
+        base_params = self._search_params(**defaults)
+
+        def search(**params) -> Dict[str, Any]:
+            if not params.keys() <= _PLAIN_SEARCH_PARAMS.keys():
+                # needs conversion, build all params
+                return self.search(**{**defaults, **params})
+            request_params = base_params.copy()
+            for name, value in params.items():
+                if value:
+                    request_params[_PLAIN_SEARCH_PARAMS[name]] = value
+                else:
+                    request_params.pop(_PLAIN_SEARCH_PARAMS[name], None)
+            return self._request("search", request_params)
+        return search
 
     def channels(self, channel_ids, max_results=50, page_token="",
-                 part='snippet') -> Dict[str, Any]:
+                 part='snippet', fields="") -> Dict[str, Any]:
         """ make /channels request to www.googleapis.com/youtube/v3.
             look at youtube api documentation:
             https://developers.google.com/youtube/v3/docs/channels/list
@@ -260,12 +540,14 @@ class YoutubeAPI:
                   'maxResults': max_results,
                   'id': ",".join(channel_ids)}
         if page_token:
-            params.update({'pageToken': page_token})
+            params['pageToken'] = page_token
+        if fields:
+            params['fields'] = fields
 
         return self._request("channels", params)
 
     def videos(self, video_ids, max_results=50, page_token="",
-               part='snippet,contentDetails') -> Dict[str, Any]:
+               part='snippet,contentDetails', fields="") -> Dict[str, Any]:
         """ make /videos request to www.googleapis.com/youtube/v3.
             look at youtube api documentation:
             https://developers.google.com/youtube/v3/docs/videos/list
@@ -274,7 +556,9 @@ class YoutubeAPI:
                   'maxResults': max_results,
                   'id': ",".join(video_ids)}
         if page_token:
-            params.update({'pageToken': page_token})
+            params['pageToken'] = page_token
+        if fields:
+            params['fields'] = fields
 
         return self._request("videos", params)
 
@@ -293,7 +577,8 @@ class YoutubeAPI:
                    caption: VideoCaption = None,
                    embeddable: VideoEmbeddable = None,
                    definition: VideoDefinition = None,
-                   related_to_video_id: str = "") -> List[Dict[str, Any]]:
+                   related_to_video_id: str = "",
+                   fields: str = "") -> List[Dict[str, Any]]:
         """ make a search request to youtube api v3, but returns a list of all
             items, instead of pages.
             returns:
@@ -308,83 +593,149 @@ class YoutubeAPI:
                              event_type=event_type, duration=duration,
                              caption=caption, embeddable=embeddable,
                              definition=definition,
-                             related_to_video_id=related_to_video_id)
-        yt_response = self.search(**search_params)
-        videos = []
-        while yt_response['items']:
-            videos.extend(yt_response['items'])
-            try:
-                search_params['page_token'] = yt_response['nextPageToken']
-                yt_response = self.search(**search_params)
-            except KeyError:
-                # got all pages, no next page
-                break
+                             related_to_video_id=related_to_video_id,
+                             fields=fields)
+        videos = list(self.search_iter(**search_params))
         self._logger.info(
                 "Fetched ALL (%i) videos from youtube." % len(videos)
         )
         return videos
 
+    def search_iter(self, prefetch=False,
+                    **search_params) -> Iterator[Dict[str, Any]]:
+        """ make search requests to youtube api v3 and yield the items of
+            all pages. takes the same params as search (without page_token).
+            the next page is requested when the current page is consumed,
+            stop iterating to stop paging.
+            Args:
+                prefetch (bool): request the next page in the background
+                    while the current page is consumed. if iteration stops
+                    early, that request was for nothing (quota!).
+        """
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            yt_response = self.search(**search_params)
+            # partial responses (fields) may leave out empty items
+            while yt_response.get('items'):
+                page_token = yt_response.get('nextPageToken')
+                next_page = None
+                if page_token:
+                    search_params['page_token'] = page_token
+                    if executor:
+                        next_page = executor.submit(self.search,
+                                                    **search_params)
+                yield from yt_response['items']
+                if not page_token:
+                    # got all pages, no next page
+                    break
+                yt_response = next_page.result() if next_page \
+                    else self.search(**search_params)
+        finally:
+            if executor:
+                executor.shutdown()
+
     def channels_all(self, channel_ids: Tuple[str] = (),
-                     part="snippet,contentDetails") -> List[Dict[str, Any]]:
+                     part="snippet,contentDetails",
+                     fields="") -> List[Dict[str, Any]]:
         """ make a channels request to youtube api v3, but returns a list of all
             items, instead of pages.
             returns:
                 list: of all response['items']. with contentDetails.
                                                 see youtube api documentation.
         """
-        max_results = 50
-        start_idx = 0
-        end_idx = max_results
-        channels = []
-        while len(channel_ids[start_idx:end_idx]):
-            response = self.channels(channel_ids[start_idx:end_idx], part=part)
-            channels.extend(response['items'])
-            start_idx += max_results
-            end_idx += max_results
-        return channels
+        return self._fetch_chunks(self.channels, channel_ids, part, fields)
 
     def videos_all(self, video_ids: Tuple[str] = (),
-                   part="snippet,contentDetails") -> List[Dict[str, Any]]:
+                   part="snippet,contentDetails",
+                   fields="") -> List[Dict[str, Any]]:
         """ make a /videos request to youtube api v3, but returns a list of all
             items, instead of pages.
+            Args:
+                video_ids (Iterable[str]): any iterable, also a generator.
             Returns:
                 list: of all response['items']. with contentDetails.
                                                 see youtube api documentation.
         """
-        max_results = 50
-        start_idx = 0
-        end_idx = max_results
-        videos = []
-        while len(video_ids[start_idx:end_idx]):
-            response = self.videos(video_ids[start_idx:end_idx], part=part)
-            videos.extend(response['items'])
-            start_idx += max_results
-            end_idx += max_results
-        return videos
+        return self._fetch_chunks(self.videos, video_ids, part, fields)
+
+    def _fetch_chunks(self, request, ids, part,
+                      fields="") -> List[Dict[str, Any]]:
+        # chunks of 50 ids are independent, request them in parallel.
+        # ids may be a generator, map submits each chunk once it is complete
+        chunks = _batched(ids, 50)
+        first = next(chunks, None)
+        if first is None:
+            return []
+        # only a full chunk can be followed by more
+        if len(first) < 50 or (isinstance(ids, Sized) and len(ids) == 50):
+            # single chunk (ie. served from the cache), no thread needed
+            responses = [request(first, part=part, fields=fields)]
+        else:
+            with ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+                responses = list(executor.map(
+                        lambda chunk: request(chunk, part=part, fields=fields),
+                        chain((first, ), chunks)
+                ))
+        return [item for response in responses
+                for item in response.get('items', [])]
+
+
+_MISSING = object()
+
+
+def _resolve(response_item, key_list):
+    # value at key_list or _MISSING if not in this response
+    value = response_item
+    try:
+        for key in key_list:
+            value = value[key]
+    except (KeyError, TypeError):
+        return _MISSING
+    return value
 
 
 class ResponseAndapter:
-    # maps attributes to response values
-    fields: Dict[str, list] = {}
+    # no per instance __dict__, there is one adapter per response item.
+    # subclasses add a slot for each of their fields.
+    __slots__ = ('_raw',)
+    # maps attributes to the key path of their response value.
+    # read only, shared by all instances
+    fields: Mapping[str, Tuple[str, ...]] = MappingProxyType({})
 
     def __init__(self, response_item):
         self._raw = response_item
-
-    def _get_value(self, key_list: list, response_element: dict) -> str:
-        key = key_list[0]
-        value = response_element[key]
-        if key_list[1:]:
-            return self._get_value(key_list[1:], value)
-        else:
-            return value
+        self._set_fields(self._fields_for(response_item))
+
+    @classmethod
+    def _fields_for(cls, response_item) -> Mapping[str, Tuple[str, ...]]:
+        return cls.fields
+
+    def _set_fields(self, fields: Mapping[str, Tuple[str, ...]]):
+        # resolve all fields once, instead of on every attribute access
+        for name, key_list in fields.items():
+            value = _resolve(self._raw, key_list)
+            if value is not _MISSING:
+                setattr(self, name, value)
+
+    @classmethod
+    def columns(cls, response_items) -> Dict[str, list]:
+        """ fields of all response items as parallel lists, without
+            creating an adapter per item. missing values are None.
+        """
+        columns = {name: [] for name in cls.fields}
+        for item in response_items:
+            for name, key_list in cls._fields_for(item).items():
+                value = _resolve(item, key_list)
+                columns[name].append(None if value is _MISSING else value)
+        return columns
 
     def __getattr__(self, name) -> str:
-        try:
-            return self._get_value(self.fields[name], self._raw)
-        except KeyError:
+        # only called for unset attributes
+        if name in self.fields:
             raise AttributeError(
                     f"can't access '{name}' from response object."
             )
+        raise AttributeError(name)
 
     @property
     def raw(self) -> dict:
@@ -393,28 +744,31 @@ class ResponseAndapter:
 
 class YoutubeVideo(ResponseAndapter):
     URL_BASE = "http://youtube.de/watch?v="
-    fields = {
-            'title': ['snippet', 'title'],
-            'description': ['snippet', 'description'],
-            'image_url': ['snippet', 'thumbnails', 'medium', 'url'],
-            'video_id': ['id', 'videoId'],
-            'published_at': ['snippet', 'publishedAt'],
-            'live_broadcast': ['snippet', 'liveBroadcastContent'],
-            'channel_id': ['snippet', 'channelId'],
-            'channel_title': ['snippet', 'channelTitle'],
-            'etag': ['etag'],
+    fields = MappingProxyType({
+            'title': ('snippet', 'title'),
+            'description': ('snippet', 'description'),
+            'image_url': ('snippet', 'thumbnails', 'medium', 'url'),
+            'video_id': ('id', 'videoId'),
+            'published_at': ('snippet', 'publishedAt'),
+            'live_broadcast': ('snippet', 'liveBroadcastContent'),
+            'channel_id': ('snippet', 'channelId'),
+            'channel_title': ('snippet', 'channelTitle'),
+            'etag': ('etag',),
             # only with content_details=True
-            'duration': ['contentDetails', 'duration'],
-            'definition': ['contentDetails', 'definition'],
-            'dimension': ['contentDetails', 'demension'],
-            'tags': ['snippet', 'tags']
-    }
-
-    def __init__(self, raw):
-        super().__init__(raw)
-        # response for /videos is different from /search.
-        if self._raw['kind'] == "youtube#video":
-            self.fields['video_id'] = ['id']
+            'duration': ('contentDetails', 'duration'),
+            'definition': ('contentDetails', 'definition'),
+            'dimension': ('contentDetails', 'dimension'),
+            'tags': ('snippet', 'tags'),
+    })
+    # response for /videos is different from /search.
+    details_fields = MappingProxyType({**fields, 'video_id': ('id',)})
+    __slots__ = tuple(fields)
+
+    @classmethod
+    def _fields_for(cls, response_item) -> Mapping[str, Tuple[str, ...]]:
+        if response_item['kind'] == "youtube#video":
+            return cls.details_fields
+        return cls.fields
 
     @property
     def url(self) -> str:
@@ -423,16 +777,17 @@ class YoutubeVideo(ResponseAndapter):
 
 class YoutubeChannel(ResponseAndapter):
     URL_BASE = "http://youtube.de/channel/"
-    fields = {
-            'title': ['snippet', 'title'],
-            'description': ['snippet', 'description'],
-            'image_url': ['snippet', 'thumbnails', 'medium', 'url'],
-            'published_at': ['snippet', 'publishedAt'],
-            'custom_url': ['snippet', 'customUrl'],
-            'channel_id': ['id'],
-            'etag': ['etag'],
-            'country': ['country'],
-    }
+    fields = MappingProxyType({
+            'title': ('snippet', 'title'),
+            'description': ('snippet', 'description'),
+            'image_url': ('snippet', 'thumbnails', 'medium', 'url'),
+            'published_at': ('snippet', 'publishedAt'),
+            'custom_url': ('snippet', 'customUrl'),
+            'channel_id': ('id',),
+            'etag': ('etag',),
+            'country': ('country',),
+    })
+    __slots__ = tuple(fields)
 
     @property
     def url(self) -> str:
@@ -440,16 +795,48 @@ class YoutubeChannel(ResponseAndapter):
 
 
 class YoutubeFinder:
+    # partial responses, only the fields YoutubeVideo/YoutubeChannel use.
+    # the top level etag is kept for cache revalidation.
+    _SNIPPET_FIELDS = ("title,description,thumbnails/medium/url,publishedAt,"
+                       "liveBroadcastContent,channelId,channelTitle")
+    SEARCH_FIELDS = ("etag,nextPageToken,"
+                     f"items(kind,etag,id,snippet({_SNIPPET_FIELDS}))")
+    SEARCH_ID_FIELDS = "etag,nextPageToken,items(id/videoId)"
+    VIDEOS_FIELDS = ("etag,items(kind,etag,id,"
+                     f"snippet({_SNIPPET_FIELDS},tags),"
+                     "contentDetails(duration,definition,dimension))")
+    # contentDetails is requested (part) and kept for YoutubeChannel.raw,
+    # ie. contentDetails/relatedPlaylists/uploads
+    CHANNELS_FIELDS = ("etag,items(kind,etag,id,snippet(title,description,"
+                       "thumbnails/medium/url,publishedAt,customUrl),"
+                       "contentDetails)")
+
     def __init__(self, developer_key, dump_dir=None, logger=None, caching=True,
                  caching_delay=timedelta(days=1.0)):
         self._logger = logger if logger else logging.getLogger(__name__)
         self._api = YoutubeAPI(developer_key, dump_dir=dump_dir,
                                logger=self._logger, caching=caching,
                                caching_delay=caching_delay)
+        # channel id -> (response item, YoutubeChannel), bounded like the
+        # api memory. adapters are reused while the response is the same.
+        self._channels: Dict[str, Tuple[Dict, YoutubeChannel]] = \
+            {} if caching else None
+
+    def close(self):
+        """ closes the http session and the request cache. """
+        self._api.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def get_channels(self,
                      channel_ids: Tuple[str] = ()) -> List[YoutubeChannel]:
         """ get channels information.
+            with caching, the YoutubeChannel of a cached response is
+            reused.
             Args:
                 channel_id (tuple): channel ids
             Returns:
@@ -457,12 +844,30 @@ class YoutubeFinder:
                     List with requested channels.
 
         """
-        items = self._api.channels_all(channel_ids)
+        items = self._api.channels_all(channel_ids,
+                                       fields=self.CHANNELS_FIELDS)
+        if self._channels is None:
+            return list(map(YoutubeChannel, items))
         channels = []
-        for channel in items:
-            channels.append(YoutubeChannel(channel))
+        for item in items:
+            cached = self._channels.get(item['id'])
+            # same response item: the api served it from memory, it is
+            # as fresh as the request cache says
+            if cached is not None and cached[0] is item:
+                channels.append(cached[1])
+                continue
+            channel = YoutubeChannel(item)
+            self._remember_channel(item['id'], (item, channel))
+            channels.append(channel)
         return channels
 
+    def _remember_channel(self, channel_id, entry):
+        # bounded fifo, same as YoutubeAPI._remember
+        if channel_id not in self._channels and \
+                len(self._channels) >= self._api.MEMORY_SIZE:
+            del self._channels[next(iter(self._channels))]
+        self._channels[channel_id] = entry
+
     def get_channel(self, channel_id: str) -> YoutubeChannel:
         return self.get_channels((channel_id, ))[0]
 
@@ -479,7 +884,8 @@ class YoutubeFinder:
                       caption: VideoCaption = None,
                       embeddable: VideoEmbeddable = None,
                       definition: VideoDefinition = None,
-                      related_to_video_id: str = "") -> List[YoutubeVideo]:
+                      related_to_video_id: str = "",
+                      max_results: int = None) -> List[YoutubeVideo]:
         """ Search for videos.
             Args:
                 content_details (bool): detail information for each video
@@ -504,13 +910,14 @@ class YoutubeFinder:
                 related_to_video_id (str): The relatedToVideoId parameter
                     retrieves a list of videos that are related to the video
                     that the parameter value identifies.
+                max_results (int): return at most max_results videos, only
+                    the needed pages are requested (default: all videos).
             Returns:
                 List[YoutubeVideo]:
                     search result containing all matching videos.
         """
-        part = "id" if content_details else "snippet"
-        response_items = self._api.search_all(
-                            part=part,
+        response_items = self._search_items(
+                            content_details, max_results,
                             channel_id=channel_id, search_query=search_query,
                             order=order, published_before=published_before,
                             published_after=published_after,
@@ -520,11 +927,38 @@ class YoutubeFinder:
                             definition=definition,
                             related_to_video_id=related_to_video_id
         )
-        if content_details:  # get addtional video data (contentDetails)
-            video_ids = [v['id']['videoId'] for v in response_items]
-            self._logger.info(f"get contentDetails for {video_ids}")
-            # get detail information for each video
-            response_items = self._api.videos_all(video_ids=video_ids)
+        return list(map(YoutubeVideo, response_items))
 
-        videos = [YoutubeVideo(v) for v in response_items]
-        return videos
+    def search_videos_columns(self, content_details=False, max_results=None,
+                              **search_params) -> Dict[str, list]:
+        """ Search for videos, takes the same params as search_videos.
+            Returns:
+                Dict[str, list]:
+                    one list per YoutubeVideo field (ie: 'video_id'),
+                    index i of every list belongs to the i-th video.
+                    missing values are None.
+        """
+        response_items = self._search_items(content_details, max_results,
+                                            **search_params)
+        return YoutubeVideo.columns(response_items)
+
+    def _search_items(self, content_details, max_results,
+                      **search_params) -> List[Dict[str, Any]]:
+        part = "id" if content_details else "snippet"
+        fields = self.SEARCH_ID_FIELDS if content_details \
+            else self.SEARCH_FIELDS
+        page_size = min(max_results, 50) if max_results else 50
+        response_items = self._api.search_iter(
+                part=part, fields=fields, max_results=page_size,
+                **search_params
+        )
+        response_items = islice(response_items, max_results)
+        if not content_details:
+            return list(response_items)
+        # get addtional video data (contentDetails).
+        # ids are passed on lazily, the /videos request of a page runs while
+        # the next search page is fetched.
+        video_ids = (v['id']['videoId'] for v in response_items)
+        self._logger.info("get contentDetails for search result")
+        return self._api.videos_all(video_ids=video_ids,
+                                    fields=self.VIDEOS_FIELDS)